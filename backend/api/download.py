@@ -5,6 +5,7 @@ Generates formatted resume output in PDF and DOCX formats.
 """
 
 import io
+import re
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -15,6 +16,7 @@ from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+import reportlab.rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -23,6 +25,82 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from api.resume import resume_store
 from api.jd import jd_store
 from api.optimize import job_store
+from services.render_plan import build_render_plan
+
+# Skip ReportLab's per-attribute shape validation on every flowable
+reportlab.rl_config.shapeChecking = 0
+
+# Stylesheet and derived styles are immutable per-request; build once at import
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=16,
+    spaceAfter=12,
+    textColor='#1a365d'
+)
+
+_SECTION_STYLE = ParagraphStyle(
+    'SectionHeader',
+    parent=_STYLES['Heading2'],
+    fontSize=12,
+    spaceBefore=16,
+    spaceAfter=8,
+    textColor='#2c5282',
+    borderColor='#2c5282',
+    borderWidth=1,
+    borderPadding=4
+)
+
+_BODY_STYLE = ParagraphStyle(
+    'BodyText',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    spaceBefore=4,
+    spaceAfter=4,
+    leading=14
+)
+
+_SCORE_STYLE = ParagraphStyle(
+    'ScoreStyle',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor='#718096',
+    alignment=2  # Right align
+)
+
+# XML escape table for Paragraph markup; one translate pass per line
+_PDF_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Output section order and display titles, shared by PDF and DOCX
+_SECTION_ORDER = ("summary", "experience", "skills", "education", "projects", "certifications")
+_SECTION_TITLES = {
+    "summary": "PROFESSIONAL SUMMARY",
+    "experience": "PROFESSIONAL EXPERIENCE",
+    "skills": "TECHNICAL SKILLS",
+    "education": "EDUCATION",
+    "projects": "PROJECTS",
+    "certifications": "CERTIFICATIONS",
+}
+
+
+def _build_docx_template() -> bytes:
+    """Build the empty narrow-margin document once at import."""
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = Inches(0.75)
+        section.bottom_margin = Inches(0.75)
+        section.left_margin = Inches(0.75)
+        section.right_margin = Inches(0.75)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+# Pre-margined template; requests reopen it from memory instead of
+# parsing python-docx's default template from disk and re-setting margins
+_DOCX_TEMPLATE = _build_docx_template()
 
 router = APIRouter()
 
@@ -48,20 +126,26 @@ async def download_resume(request: ResumeOutputRequest):
     result = job.get("result", {})
     optimized_resume = result.get("optimized_resume", {})
     ats_score = result.get("ats_score", 0)
-    
+
+    # Use the plan precomputed at optimize time (build it for jobs
+    # stored before the plan existed)
+    render_plan = job.get("render_plan") or build_render_plan(optimized_resume)
+
     if request.format == "docx":
         # Generate DOCX
-        doc_bytes = _generate_docx(optimized_resume, ats_score)
+        buffer = _generate_docx(render_plan, ats_score)
+        buffer.seek(0)
         return StreamingResponse(
-            io.BytesIO(doc_bytes),
+            buffer,
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             headers={"Content-Disposition": "attachment; filename=optimized_resume.docx"}
         )
     else:
         # Generate PDF (default)
-        pdf_bytes = _generate_pdf(optimized_resume, ats_score)
+        buffer = _generate_pdf(render_plan, ats_score)
+        buffer.seek(0)
         return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+            buffer,
             media_type="application/pdf",
             headers={"Content-Disposition": "attachment; filename=optimized_resume.pdf"}
         )
@@ -94,106 +178,42 @@ async def get_formatted_resume(resume_id: str, jd_id: Optional[str] = None):
     }
 
 
-def _generate_pdf(sections: dict, ats_score: int) -> bytes:
-    """Generate a professional PDF resume."""
+def _generate_pdf(render_plan: dict, ats_score: int) -> io.BytesIO:
+    """Generate a professional PDF resume from a render plan."""
     buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, 
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
                            rightMargin=72, leftMargin=72,
                            topMargin=72, bottomMargin=72)
-    
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=12,
-        textColor='#1a365d'
-    )
-    
-    section_style = ParagraphStyle(
-        'SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=12,
-        spaceBefore=16,
-        spaceAfter=8,
-        textColor='#2c5282',
-        borderColor='#2c5282',
-        borderWidth=1,
-        borderPadding=4
-    )
-    
-    body_style = ParagraphStyle(
-        'BodyText',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceBefore=4,
-        spaceAfter=4,
-        leading=14
-    )
-    
-    score_style = ParagraphStyle(
-        'ScoreStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor='#718096',
-        alignment=2  # Right align
-    )
-    
+
     story = []
-    
+
     # Header with ATS Score
-    story.append(Paragraph(f"ATS Compatibility Score: {ats_score}/100", score_style))
+    story.append(Paragraph(f"ATS Compatibility Score: {ats_score}/100", _SCORE_STYLE))
     story.append(Spacer(1, 12))
-    
-    # Section order
-    section_order = ["summary", "experience", "skills", "education", "projects", "certifications"]
-    section_titles = {
-        "summary": "PROFESSIONAL SUMMARY",
-        "experience": "PROFESSIONAL EXPERIENCE", 
-        "skills": "TECHNICAL SKILLS",
-        "education": "EDUCATION",
-        "projects": "PROJECTS",
-        "certifications": "CERTIFICATIONS"
-    }
-    
-    for section_name in section_order:
-        if section_name in sections and sections[section_name]:
-            content = sections[section_name]
-            
+
+    for section_name in _SECTION_ORDER:
+        if render_plan.get(section_name):
             # Section header
-            title = section_titles.get(section_name, section_name.upper())
-            story.append(Paragraph(title, section_style))
-            
-            # Section content - handle line breaks
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line:
-                    # Escape special characters for PDF
-                    line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                    if line.startswith('-'):
-                        line = '• ' + line[1:].strip()
-                    story.append(Paragraph(line, body_style))
-            
+            title = _SECTION_TITLES.get(section_name, section_name.upper())
+            story.append(Paragraph(title, _SECTION_STYLE))
+
+            for kind, text in render_plan[section_name]:
+                # Escape special characters for PDF
+                text = text.translate(_PDF_ESCAPE)
+                if kind == "bullet":
+                    text = '• ' + text
+                story.append(Paragraph(text, _BODY_STYLE))
+
             story.append(Spacer(1, 8))
-    
+
     doc.build(story)
-    return buffer.getvalue()
+    return buffer
 
 
-def _generate_docx(sections: dict, ats_score: int) -> bytes:
-    """Generate a professional DOCX resume."""
-    doc = Document()
-    
-    # Set narrow margins
-    for section in doc.sections:
-        section.top_margin = Inches(0.75)
-        section.bottom_margin = Inches(0.75)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
-    
+def _generate_docx(render_plan: dict, ats_score: int) -> io.BytesIO:
+    """Generate a professional DOCX resume from a render plan."""
+    doc = Document(io.BytesIO(_DOCX_TEMPLATE))
+
     # ATS Score header
     score_para = doc.add_paragraph()
     score_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
@@ -201,44 +221,24 @@ def _generate_docx(sections: dict, ats_score: int) -> bytes:
     score_run.font.size = Pt(9)
     score_run.font.italic = True
     
-    # Section order
-    section_order = ["summary", "experience", "skills", "education", "projects", "certifications"]
-    section_titles = {
-        "summary": "PROFESSIONAL SUMMARY",
-        "experience": "PROFESSIONAL EXPERIENCE",
-        "skills": "TECHNICAL SKILLS", 
-        "education": "EDUCATION",
-        "projects": "PROJECTS",
-        "certifications": "CERTIFICATIONS"
-    }
-    
-    for section_name in section_order:
-        if section_name in sections and sections[section_name]:
-            content = sections[section_name]
-            
+    for section_name in _SECTION_ORDER:
+        if render_plan.get(section_name):
             # Section header
-            title = section_titles.get(section_name, section_name.upper())
+            title = _SECTION_TITLES.get(section_name, section_name.upper())
             heading = doc.add_heading(title, level=2)
             heading.runs[0].font.size = Pt(11)
-            
-            # Section content
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line:
-                    if line.startswith('-'):
-                        # Bullet point
-                        para = doc.add_paragraph(line[1:].strip(), style='List Bullet')
-                        para.runs[0].font.size = Pt(10)
-                    else:
-                        # Regular paragraph
-                        para = doc.add_paragraph(line)
-                        para.runs[0].font.size = Pt(10)
+
+            for kind, text in render_plan[section_name]:
+                if kind == "bullet":
+                    para = doc.add_paragraph(text, style='List Bullet')
+                else:
+                    para = doc.add_paragraph(text)
+                para.runs[0].font.size = Pt(10)
     
     # Save to bytes
     buffer = io.BytesIO()
     doc.save(buffer)
-    return buffer.getvalue()
+    return buffer
 
 
 def _format_resume_with_keywords(sections: dict, keywords: list) -> str:
@@ -246,20 +246,30 @@ def _format_resume_with_keywords(sections: dict, keywords: list) -> str:
     Format resume with keyword highlights.
     Keywords in the resume are marked with asterisks.
     """
-    import re
     lines = []
-    
+
     section_order = ["summary", "experience", "skills", "education"]
-    
+
+    # One alternation regex for all keywords, compiled once per request
+    highlight_re = None
+    if keywords:
+        canonical = {k.lower(): k for k in keywords}
+        highlight_re = re.compile(
+            '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)),
+            re.IGNORECASE,
+        )
+
     for section_name in section_order:
         if section_name in sections and sections[section_name]:
             content = sections[section_name]
-            
-            # Highlight keywords (case-insensitive)
-            for keyword in keywords:
-                pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                content = pattern.sub(f"**{keyword}**", content)
-            
+
+            # Highlight keywords (case-insensitive) in a single pass
+            if highlight_re:
+                content = highlight_re.sub(
+                    lambda m: f"**{canonical[m.group(0).lower()]}**",
+                    content,
+                )
+
             lines.append(f"## {section_name.title()}")
             lines.append(content)
             lines.append("")
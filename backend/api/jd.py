@@ -2,6 +2,7 @@
 Job Description Extraction API
 """
 
+import hashlib
 import uuid
 import re
 from typing import Optional
@@ -10,11 +11,39 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from services.jd_intelligence import extract_jd_intelligence
+from services.store import get_store
 
 router = APIRouter()
 
-# In-memory store
-jd_store: dict = {}
+# JD store (memory by default; Redis/SQLite via store_backend setting)
+jd_store = get_store("jd")
+
+# Content hash -> jd_id, so re-posting the same JD reuses its extraction
+_jd_hash_store = get_store("jd_hash")
+
+# Noise section headers, merged into one alternation compiled at import
+_NOISE_RE = re.compile(
+    r'^(?:benefits|perks|what we offer'
+    r'|about us|about the company|who we are'
+    r'|equal opportunity|eeo|diversity'
+    r'|how to apply|to apply'
+    r'|salary|compensation|pay range)\b',
+    re.IGNORECASE,
+)
+
+# Cheap startswith pre-filter for the noise check; almost every JD line
+# fails this, skipping the regex entirely. _NOISE_RE confirms the word
+# boundary on the rare candidate lines.
+_NOISE_PREFIXES = (
+    "benefits", "perks", "what we offer",
+    "about us", "about the company", "who we are",
+    "equal opportunity", "eeo", "diversity",
+    "how to apply", "to apply",
+    "salary", "compensation", "pay range",
+)
+
+# "New major section" header shape (e.g. "Requirements:")
+_SECTION_HEADER_RE = re.compile(r'^[A-Z][A-Za-z\s]+:?\s*$')
 
 
 class JDInput(BaseModel):
@@ -40,19 +69,29 @@ async def extract_jd(input_data: JDInput):
     """
     if not input_data.text and not input_data.url:
         raise HTTPException(400, "Provide either text or URL")
-    
-    jd_id = f"jd-{uuid.uuid4().hex[:8]}"
-    
+
     # Get JD text
     if input_data.url:
         # For MVP, just require text input
         raise HTTPException(400, "URL extraction not yet supported. Please paste JD text.")
-    
+
     raw_text = input_data.text.strip()
-    
+
     if len(raw_text) < 100:
         raise HTTPException(400, "Job description too short")
-    
+
+    # Same content already extracted? Reuse the stored result.
+    content_hash = hashlib.blake2b(raw_text.encode(), digest_size=16).hexdigest()
+    existing_id = _jd_hash_store.get(content_hash)
+    if existing_id is not None and existing_id in jd_store:
+        stored = jd_store[existing_id]
+        return {
+            "jd_id": existing_id,
+            **{k: v for k, v in stored.items() if k not in ("raw_text", "cleaned_text")},
+        }
+
+    jd_id = f"jd-{uuid.uuid4().hex[:8]}"
+
     # Clean JD (remove noise sections)
     cleaned_text = _clean_jd(raw_text)
     
@@ -65,7 +104,9 @@ async def extract_jd(input_data: JDInput):
         "cleaned_text": cleaned_text,
         **intelligence,
     }
-    
+    _jd_hash_store[content_hash] = jd_id
+
+
     return {
         "jd_id": jd_id,
         **intelligence,
@@ -95,27 +136,23 @@ def _clean_jd(text: str) -> str:
     lines = text.split('\n')
     cleaned_lines = []
     skip_section = False
-    
-    noise_patterns = [
-        r'(?i)^(benefits|perks|what we offer)',
-        r'(?i)^(about us|about the company|who we are)',
-        r'(?i)^(equal opportunity|eeo|diversity)',
-        r'(?i)^(how to apply|to apply)',
-        r'(?i)^(salary|compensation|pay range)',
-    ]
-    
+
     for line in lines:
-        # Check if entering noise section
-        for pattern in noise_patterns:
-            if re.match(pattern, line.strip()):
-                skip_section = True
-                break
-        
-        # Reset on new major section
-        if re.match(r'^[A-Z][A-Za-z\s]+:?\s*$', line.strip()) and len(line.strip()) < 50:
-            if not any(re.match(p, line.strip()) for p in noise_patterns):
-                skip_section = False
-        
+        stripped = line.strip()
+
+        # Check if entering noise section (startswith fast-path, then
+        # regex to confirm the word boundary)
+        is_noise = (
+            stripped.lower().startswith(_NOISE_PREFIXES)
+            and _NOISE_RE.match(stripped) is not None
+        )
+        if is_noise:
+            skip_section = True
+
+        # Reset on new major (non-noise) section
+        elif skip_section and len(stripped) < 50 and _SECTION_HEADER_RE.match(stripped):
+            skip_section = False
+
         if not skip_section:
             cleaned_lines.append(line)
     
@@ -5,19 +5,21 @@ Resume Optimization API
 import uuid
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 
 from api.resume import resume_store
 from api.jd import jd_store
 from services.gap_analyzer import analyze_gaps
+from services.render_plan import build_render_plan
 from services.rewriter import rewrite_resume
 from services.scorer import calculate_ats_score
+from services.store import get_store
 
 router = APIRouter()
 
-# Job store for async processing
-job_store: dict = {}
+# Job store for async processing (memory by default; see store_backend)
+job_store = get_store("job")
 
 
 class OptimizeRequest(BaseModel):
@@ -26,61 +28,85 @@ class OptimizeRequest(BaseModel):
 
 
 @router.post("/optimize")
-async def start_optimization(request: OptimizeRequest):
+async def start_optimization(request: OptimizeRequest, background_tasks: BackgroundTasks):
     """
     Start resume optimization job.
+
+    Returns immediately with a job_id; the pipeline runs as a background
+    task and progress is observable via /job/{job_id}/status.
     """
     # Validate inputs
     if request.resume_id not in resume_store:
         raise HTTPException(404, "Resume not found")
     if request.jd_id not in jd_store:
         raise HTTPException(404, "JD not found")
-    
+
     job_id = f"job-{uuid.uuid4().hex[:8]}"
-    
+
     # Get data
     resume_data = resume_store[request.resume_id]
     jd_data = jd_store[request.jd_id]
-    
-    # For MVP, process synchronously (add Celery later)
+
     job_store[job_id] = {
-        "status": "processing",
+        "status": "queued",
         "progress": 0,
-        "step": "Starting optimization",
+        "step": "Queued",
         "resume_id": request.resume_id,
         "jd_id": request.jd_id,
     }
-    
+
+    background_tasks.add_task(
+        _run_pipeline, job_id, request.resume_id, request.jd_id, resume_data, jd_data
+    )
+
+    return {
+        "job_id": job_id,
+        "status": "queued",
+    }
+
+
+def _run_pipeline(job_id: str, resume_id: str, jd_id: str, resume_data: dict, jd_data: dict):
+    """Run gap analysis, rewrite, and scoring for a queued job."""
+    job = {
+        "status": "processing",
+        "progress": 0,
+        "step": "Starting optimization",
+        "resume_id": resume_id,
+        "jd_id": jd_id,
+    }
+    job_store[job_id] = job
+
     try:
         # Step 1: Gap Analysis (20%)
-        job_store[job_id]["step"] = "Analyzing gaps"
-        job_store[job_id]["progress"] = 20
-        
+        job.update(step="Analyzing gaps", progress=20)
+        job_store[job_id] = job
+
         gaps = analyze_gaps(resume_data["sections"], jd_data)
-        
+
         # Step 2: Rewrite (60%)
-        job_store[job_id]["step"] = "Rewriting resume"
-        job_store[job_id]["progress"] = 40
-        
+        job.update(step="Rewriting resume", progress=40)
+        job_store[job_id] = job
+
         optimized_sections = rewrite_resume(
             resume_data["sections"],
             jd_data,
             gaps,
         )
-        
-        job_store[job_id]["progress"] = 70
-        
+
         # Step 3: Score (90%)
-        job_store[job_id]["step"] = "Calculating ATS score"
-        job_store[job_id]["progress"] = 90
-        
+        job.update(step="Calculating ATS score", progress=90)
+        job_store[job_id] = job
+
         score_result = calculate_ats_score(optimized_sections, jd_data)
-        
+
         # Complete
-        job_store[job_id] = {
+        job = {
             "status": "completed",
             "progress": 100,
             "step": "Complete",
+            # Pre-normalized lines for the download generators, so
+            # repeat PDF/DOCX downloads skip the per-line string work
+            "render_plan": build_render_plan(optimized_sections),
             "result": {
                 "optimized_resume": optimized_sections,
                 "ats_score": score_result["score"],
@@ -88,14 +114,11 @@ async def start_optimization(request: OptimizeRequest):
                 "remaining_gaps": gaps["optional"],
             },
         }
-        
+        job_store[job_id] = job
+
     except Exception as e:
-        job_store[job_id] = {
+        job = {
             "status": "failed",
             "error": str(e),
         }
-    
-    return {
-        "job_id": job_id,
-        "status": job_store[job_id]["status"],
-    }
+        job_store[job_id] = job
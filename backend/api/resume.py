@@ -12,12 +12,13 @@ from pydantic import BaseModel
 from config import get_settings
 from services.parser import extract_text_from_pdf, extract_text_from_txt
 from services.section_detector import detect_sections
+from services.store import get_store
 
 settings = get_settings()
 router = APIRouter()
 
-# In-memory store (replace with DB in production)
-resume_store: dict = {}
+# Resume store (memory by default; Redis/SQLite via store_backend setting)
+resume_store = get_store("resume")
 
 
 class ResumeTextInput(BaseModel):
@@ -60,14 +61,13 @@ async def upload_resume(
         if not (filename.endswith('.pdf') or filename.endswith('.txt')):
             raise HTTPException(400, "Only PDF and TXT files are supported")
         
-        # Read file
-        content = await file.read()
-        
         # Extract text
         if filename.endswith('.pdf'):
-            raw_text = extract_text_from_pdf(content)
+            # Hand the spooled temp file to the parser instead of
+            # buffering the whole upload in memory first
+            raw_text = extract_text_from_pdf(file.file)
         else:
-            raw_text = extract_text_from_txt(content)
+            raw_text = extract_text_from_txt(await file.read())
     else:
         raw_text = text.strip()
     
@@ -105,8 +105,10 @@ async def get_resume(resume_id: str):
 @router.put("/resume/{resume_id}/sections")
 async def update_sections(resume_id: str, sections: dict):
     """Update resume sections (user edits)."""
-    if resume_id not in resume_store:
+    resume_data = resume_store.get(resume_id)
+    if resume_data is None:
         raise HTTPException(404, "Resume not found")
-    
-    resume_store[resume_id]["sections"] = sections
+
+    resume_data["sections"] = sections
+    resume_store[resume_id] = resume_data
     return {"status": "updated", "resume_id": resume_id}
@@ -18,6 +18,10 @@ class Settings(BaseSettings):
     
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+
+    # Storage backend: memory, redis, or sqlite
+    store_backend: str = "memory"
+    store_ttl_hours: int = 24
     
     # OpenAI
     openai_api_key: str = ""
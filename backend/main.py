@@ -7,6 +7,8 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config import get_settings
 from api import resume, jd, optimize, job, download
@@ -26,8 +28,13 @@ app = FastAPI(
     description="Transform resumes into ATS-optimized documents",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes the large resume/result payloads in C
+    default_response_class=ORJSONResponse,
 )
 
+# Compress text-heavy responses (raw resume text, optimize results)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
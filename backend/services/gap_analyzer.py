@@ -8,6 +8,31 @@ import re
 from typing import Dict, List, Set
 
 
+# Common tech skills, merged into one alternation compiled at import
+_RESUME_SKILL_RE = re.compile(
+    '|'.join([
+        r'\b(?:python|java|javascript|typescript|c\+\+|c#|go|rust|ruby|php)\b',
+        r'\b(?:react|angular|vue|node\.?js|django|flask|spring|\.net)\b',
+        r'\b(?:aws|azure|gcp|docker|kubernetes|terraform)\b',
+        r'\b(?:postgresql|mysql|mongodb|redis|elasticsearch)\b',
+        r'\b(?:git|linux|agile|scrum|ci/cd)\b',
+        r'\b(?:machine learning|deep learning|data science)\b',
+        r'\b(?:sql|html|css|rest|api|microservices)\b',
+    ]),
+    re.IGNORECASE,
+)
+
+# Weak-bullet detection patterns, compiled once for the per-bullet loop
+_BULLET_SPLIT = re.compile(r'\n[-•]\s*|\n\d+\.\s*')
+_ACTION_VERB_RE = re.compile(
+    r'^(?:led|developed|built|created|managed|designed|implemented'
+    r'|achieved|increased|reduced|delivered|launched|optimized)',
+    re.IGNORECASE,
+)
+_METRIC_RE = re.compile(r'\d+%|\d+x|\$\d+|\d+ (?:users|customers|team|projects)', re.IGNORECASE)
+_PASSIVE_RE = re.compile(r'\b(?:was|were|been|being)\s+\w+ed\b', re.IGNORECASE)
+
+
 def analyze_gaps(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
     """
     Analyze gaps between resume and JD.
@@ -17,14 +42,14 @@ def analyze_gaps(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
         - optional: Nice-to-have skills for ranking
         - weak_bullets: Experience bullets that could be improved
     """
-    # Get resume skills
+    # Get resume skills (scanned per section; no joined temporary)
     resume_skills = _extract_resume_skills(resume_sections)
-    resume_text = ' '.join(resume_sections.values()).lower()
     
-    # Get JD requirements
-    jd_primary = set(s.lower() for s in jd_data.get("keywords", {}).get("primary", []))
-    jd_secondary = set(s.lower() for s in jd_data.get("keywords", {}).get("secondary", []))
-    jd_hard_skills = set(s.lower() for s in jd_data.get("hard_skills", []))
+    # Get JD requirements (lowercased once at extraction time)
+    keywords = jd_data.get("keywords", {})
+    jd_primary = set(keywords.get("primary_lower", []))
+    jd_secondary = set(keywords.get("secondary_lower", []))
+    jd_hard_skills = set(jd_data.get("hard_skills_lower", []))
     
     # Find missing skills
     missing_primary = jd_primary - resume_skills
@@ -53,26 +78,15 @@ def analyze_gaps(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
 
 
 def _extract_resume_skills(sections: Dict[str, str]) -> Set[str]:
-    """Extract skills mentioned in resume."""
-    all_text = ' '.join(sections.values()).lower()
-    
-    # Common tech skills
-    skills = set()
-    
-    skill_patterns = [
-        r'\b(python|java|javascript|typescript|c\+\+|c#|go|rust|ruby|php)\b',
-        r'\b(react|angular|vue|node\.?js|django|flask|spring|\.net)\b',
-        r'\b(aws|azure|gcp|docker|kubernetes|terraform)\b',
-        r'\b(postgresql|mysql|mongodb|redis|elasticsearch)\b',
-        r'\b(git|linux|agile|scrum|ci/cd)\b',
-        r'\b(machine learning|deep learning|data science)\b',
-        r'\b(sql|html|css|rest|api|microservices)\b',
-    ]
-    
-    for pattern in skill_patterns:
-        matches = re.findall(pattern, all_text, re.I)
-        skills.update(m.lower() for m in matches)
-    
+    """
+    Extract skills mentioned in resume.
+
+    Scans each section separately rather than joining them into one
+    big lowercased temporary string.
+    """
+    skills: Set[str] = set()
+    for text in sections.values():
+        skills.update(m.group(0) for m in _RESUME_SKILL_RE.finditer(text.lower()))
     return skills
 
 
@@ -87,39 +101,38 @@ def _identify_weak_bullets(experience_text: str) -> List[Dict]:
     - Passive voice
     """
     weak = []
-    
+
     # Split into bullet points
-    bullets = re.split(r'\n[-•]\s*|\n\d+\.\s*', experience_text)
-    
+    bullets = _BULLET_SPLIT.split(experience_text)
+
     for i, bullet in enumerate(bullets):
         bullet = bullet.strip()
-        if not bullet or len(bullet) < 20:
+        length = len(bullet)
+        if length < 20:
             continue
-        
+
         issues = []
-        
+
         # Check for action verb
-        action_verbs = r'^(led|developed|built|created|managed|designed|implemented|achieved|increased|reduced|delivered|launched|optimized)'
-        if not re.match(action_verbs, bullet, re.I):
+        if not _ACTION_VERB_RE.match(bullet):
             issues.append("missing_action_verb")
-        
+
         # Check for metrics
-        if not re.search(r'\d+%|\d+x|\$\d+|\d+ (users|customers|team|projects)', bullet, re.I):
+        if not _METRIC_RE.search(bullet):
             issues.append("no_metrics")
-        
+
         # Check for passive voice
-        passive_patterns = r'\b(was|were|been|being)\s+\w+ed\b'
-        if re.search(passive_patterns, bullet, re.I):
+        if _PASSIVE_RE.search(bullet):
             issues.append("passive_voice")
-        
+
         # Too short
-        if len(bullet) < 50:
+        if length < 50:
             issues.append("too_short")
-        
+
         if issues:
             weak.append({
                 "index": i,
-                "text": bullet[:100] + "..." if len(bullet) > 100 else bullet,
+                "text": bullet[:100] + "..." if length > 100 else bullet,
                 "issues": issues,
             })
     
@@ -5,7 +5,16 @@ Extracts structured information from job descriptions.
 """
 
 import re
-from typing import Dict, List, Set
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
+
+# Optional Aho-Corasick matcher for single-pass skill scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 
 # Common tech skills database
@@ -42,18 +51,55 @@ SOFT_SKILLS = {
     "critical thinking", "attention to detail", "time management",
 }
 
+# Skill alternations compiled once; longest-first so "node.js" beats "node"
+_HARD_SKILL_RE = re.compile(
+    r'\b(' + '|'.join(sorted(map(re.escape, TECH_SKILLS), key=len, reverse=True)) + r')\b',
+    re.IGNORECASE,
+)
+_SOFT_SKILL_RE = re.compile(
+    r'\b(' + '|'.join(sorted(map(re.escape, SOFT_SKILLS), key=len, reverse=True)) + r')\b',
+    re.IGNORECASE,
+)
+
+# Keyword tokenizer
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# One automaton over all skills: a single O(len(text)) scan replaces
+# one alternation pass per skill class
+if AHOCORASICK_AVAILABLE:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in TECH_SKILLS:
+        _SKILL_AUTOMATON.add_word(_skill, ("hard", _skill))
+    for _skill in SOFT_SKILLS:
+        _SKILL_AUTOMATON.add_word(_skill, ("soft", _skill))
+    _SKILL_AUTOMATON.make_automaton()
+
 # Seniority indicators
 SENIORITY_PATTERNS = {
-    "senior": [r"(?i)\bsenior\b", r"(?i)\bsr\.?\b", r"(?i)\blead\b", r"(?i)\bstaff\b"],
-    "mid": [r"(?i)\bmid[\s-]?level\b", r"(?i)\bintermediate\b"],
-    "junior": [r"(?i)\bjunior\b", r"(?i)\bjr\.?\b", r"(?i)\bentry[\s-]?level\b"],
-    "principal": [r"(?i)\bprincipal\b", r"(?i)\barchitect\b", r"(?i)\bdirector\b"],
+    "senior": [r"\bsenior\b", r"\bsr\.?\b", r"\blead\b", r"\bstaff\b"],
+    "mid": [r"\bmid[\s-]?level\b", r"\bintermediate\b"],
+    "junior": [r"\bjunior\b", r"\bjr\.?\b", r"\bentry[\s-]?level\b"],
+    "principal": [r"\bprincipal\b", r"\barchitect\b", r"\bdirector\b"],
 }
 
+# All levels in one alternation with named groups: one scan of the JD,
+# the matched group name is the level
+_SENIORITY_RE = re.compile(
+    '|'.join(
+        f"(?P<{level}>{'|'.join(patterns)})"
+        for level, patterns in SENIORITY_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
 
+@lru_cache(maxsize=512)
 def extract_jd_intelligence(text: str) -> Dict:
     """
     Extract structured intelligence from job description.
+
+    Pure function of the text, so results are memoized: re-posting the
+    same JD skips all regex work. Callers must not mutate the result.
     """
     text_lower = text.lower()
     
@@ -62,17 +108,19 @@ def extract_jd_intelligence(text: str) -> Dict:
     seniority = _detect_seniority(text)
     
     # Extract skills
-    hard_skills = _extract_hard_skills(text_lower)
-    soft_skills = _extract_soft_skills(text_lower)
+    hard_skills, soft_skills = _extract_skills(text_lower)
     tools = _extract_tools(text_lower)
     
     # Extract keywords
     keywords = _extract_keywords(text, hard_skills)
-    
+
     return {
         "role": role,
         "seniority": seniority,
         "hard_skills": list(hard_skills),
+        # Lowercased once here so consumers (gap analysis, scoring)
+        # don't re-lowercase per request
+        "hard_skills_lower": [s.lower() for s in hard_skills],
         "soft_skills": list(soft_skills),
         "tools": list(tools),
         "keywords": keywords,
@@ -97,36 +145,44 @@ def _extract_role(text: str) -> str:
 
 def _detect_seniority(text: str) -> str:
     """Detect seniority level from JD."""
-    for level, patterns in SENIORITY_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text):
-                return level
-    return "mid"
+    match = _SENIORITY_RE.search(text)
+    return match.lastgroup if match else "mid"
 
 
-def _extract_hard_skills(text: str) -> Set[str]:
-    """Extract technical/hard skills."""
-    found = set()
-    
-    for skill in TECH_SKILLS:
-        # Match whole words
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text, re.I):
-            found.add(skill.title() if len(skill) > 3 else skill.upper())
-    
-    return found
+def _extract_skills(text: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Extract (hard, soft) skills from lowercased text.
 
+    Uses one Aho-Corasick pass over the text when available, otherwise
+    falls back to the two compiled alternation scans.
+    """
+    if AHOCORASICK_AVAILABLE:
+        hard, soft = _scan_skill_automaton(text)
+    else:
+        hard = {m.group(1).lower() for m in _HARD_SKILL_RE.finditer(text)}
+        soft = {m.group(1).lower() for m in _SOFT_SKILL_RE.finditer(text)}
 
-def _extract_soft_skills(text: str) -> Set[str]:
-    """Extract soft skills."""
-    found = set()
-    
-    for skill in SOFT_SKILLS:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text, re.I):
-            found.add(skill.title())
-    
-    return found
+    return (
+        {skill.title() if len(skill) > 3 else skill.upper() for skill in hard},
+        {skill.title() for skill in soft},
+    )
+
+
+def _scan_skill_automaton(text: str) -> Tuple[Set[str], Set[str]]:
+    """Single linear scan for all skills, with word-boundary filtering."""
+    hard: Set[str] = set()
+    soft: Set[str] = set()
+    last = len(text) - 1
+
+    for end, (category, skill) in _SKILL_AUTOMATON.iter(text):
+        start = end - len(skill) + 1
+        if start > 0 and text[start - 1].isalnum():
+            continue
+        if end < last and text[end + 1].isalnum():
+            continue
+        (hard if category == "hard" else soft).add(skill)
+
+    return hard, soft
 
 
 def _extract_tools(text: str) -> Set[str]:
@@ -154,19 +210,20 @@ def _extract_keywords(text: str, hard_skills: Set[str]) -> Dict[str, List[str]]:
     Primary: Likely used for filtering
     Secondary: Used for ranking
     """
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-    word_freq = {}
-    
-    for word in words:
-        word_freq[word] = word_freq.get(word, 0) + 1
-    
+    word_freq = Counter(_WORD_RE.findall(text.lower()))
+
     # Primary keywords: hard skills that appear multiple times
     primary = [s for s in hard_skills if word_freq.get(s.lower(), 0) >= 2]
     
     # Secondary: other skills
     secondary = [s for s in hard_skills if s not in primary]
-    
+
+    primary = primary[:10]
+    secondary = secondary[:10]
+
     return {
-        "primary": primary[:10],
-        "secondary": secondary[:10],
+        "primary": primary,
+        "secondary": secondary,
+        "primary_lower": [s.lower() for s in primary],
+        "secondary_lower": [s.lower() for s in secondary],
     }
@@ -3,43 +3,199 @@ PDF & Text Parsing Service
 """
 
 import io
+import math
+import os
 import re
-from typing import Union
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Optional, Union
 
+# Optional fast PDF engine (native PDFium); pdfplumber stays as fallback
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
 
-def extract_text_from_pdf(content: bytes) -> str:
+# Optional encoding detector for TXT uploads
+try:
+    from charset_normalizer import from_bytes as _charset_from_bytes
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+# Normalization tables/patterns, built once (runs on every parsed resume)
+_BULLET_TRANSLATE = {ord(c): ord('-') for c in '•●○◦▪▫►▻◆◇★☆✓✔✕✖✗✘→'}
+_WS_RE = re.compile(r'[ \t]+')
+_NL_RE = re.compile(r'\n{3,}')
+_PAGENUM_RE = re.compile(r'\n\s*\d+\s*\n')
+
+# 256-byte table mapping non-printable bytes to space (tab/LF/CR kept),
+# used by the fallback extractor before decoding
+_PRINTABLE_TABLE = bytes(
+    b if (32 <= b < 127) or b in (9, 10, 13) else 32 for b in range(256)
+)
+
+
+# Bytes inputs above this size go through a spooled temp file instead of
+# sitting in heap memory for the whole extraction
+_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+
+def extract_text_from_pdf(source: Union[bytes, BinaryIO, None] = None,
+                          path: Optional[str] = None) -> str:
     """
     Extract text from PDF using pdfplumber.
     Preserves layout as much as possible.
+
+    Accepts raw bytes or a binary file-like (e.g. an upload's spooled
+    temp file), so callers can stream without slurping the whole file.
+    When a filesystem `path` is given, the file is memory-mapped so the
+    OS pages in only what the PDF engine actually reads.
+
+    Prefers pypdfium2 (native text extraction, much cheaper per page
+    than pdfplumber's layout analysis) and falls back to pdfplumber.
     """
+    if path is not None:
+        # The engines read incrementally from the handle (PDFium via its
+        # custom-document loader), so the OS page cache serves only the
+        # parts actually touched — no whole-file heap copy
+        with open(path, 'rb') as f:
+            return _extract_stream(f)
+
+    if isinstance(source, bytes) and len(source) > _SPOOL_MAX_BYTES:
+        # Pathologically large uploads spill to disk; small ones would
+        # stay in RAM, but those take the plain BytesIO path below
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spool:
+            spool.write(source)
+            spool.seek(0)
+            return _extract_stream(spool)
+
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    return _extract_stream(stream)
+
+
+def _extract_stream(stream: BinaryIO) -> str:
+    """Run the best available PDF engine over an open binary stream."""
+    if PDFIUM_AVAILABLE:
+        return _pdfium_extract(stream)
+
     try:
         import pdfplumber
     except ImportError:
-        # Fallback without pdfplumber
-        return _simple_pdf_extract(content)
-    
-    text_parts = []
-    
-    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        # Fallback without any PDF engine
+        return _simple_pdf_extract(stream.read())
+
+    buf = io.StringIO()
+
+    with pdfplumber.open(stream) as pdf:
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text:
-                text_parts.append(page_text)
-    
-    full_text = '\n\n'.join(text_parts)
-    return _normalize_text(full_text)
+                buf.write(page_text)
+                buf.write('\n\n')
+            # Drop pdfplumber's cached objects so memory stays bounded
+            # to roughly one page instead of the whole document
+            page.flush_cache()
+
+    return _normalize_text(buf.getvalue().rstrip())
+
+
+# Documents below this page count are extracted sequentially; process
+# startup and a second PDF open cost more than they save on a resume
+_PARALLEL_PAGE_THRESHOLD = 8
+
+
+def _pdfium_extract(stream: BinaryIO) -> str:
+    """Extract text page-by-page via PDFium."""
+    buf = io.StringIO()
+
+    pdf = pdfium.PdfDocument(stream)
+    try:
+        n_pages = len(pdf)
+        if n_pages >= _PARALLEL_PAGE_THRESHOLD:
+            pdf.close()
+            pdf = None
+            stream.seek(0)
+            return _pdfium_extract_parallel(stream.read(), n_pages)
+
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            if page_text:
+                buf.write(page_text)
+                buf.write('\n\n')
+            textpage.close()
+            page.close()
+    finally:
+        if pdf is not None:
+            pdf.close()
+
+    return _normalize_text(buf.getvalue().rstrip())
+
+
+def _pdfium_extract_parallel(content: bytes, n_pages: int) -> str:
+    """
+    Extract a long PDF with one worker process per page block.
+
+    Page extraction is CPU-bound, so blocks run in separate processes;
+    each worker opens its own document handle on the bytes and the
+    results are rejoined in page order.
+    """
+    workers = min(os.cpu_count() or 1, 4)
+    block = math.ceil(n_pages / workers)
+    ranges = [(start, min(start + block, n_pages)) for start in range(0, n_pages, block)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_extract_page_block, [content] * len(ranges),
+                              [r[0] for r in ranges], [r[1] for r in ranges]))
+
+    return _normalize_text('\n\n'.join(p for p in parts if p))
+
+
+def _extract_page_block(content: bytes, start: int, stop: int) -> str:
+    """Worker: extract text for pages [start, stop)."""
+    buf = io.StringIO()
+
+    pdf = pdfium.PdfDocument(io.BytesIO(content))
+    try:
+        for i in range(start, stop):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            if page_text:
+                buf.write(page_text)
+                buf.write('\n\n')
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+
+    return buf.getvalue().rstrip()
 
 
 def extract_text_from_txt(content: bytes) -> str:
     """Extract and normalize text from TXT file."""
-    # Try different encodings
+    # BOM tells us the encoding outright
+    if content.startswith(b'\xef\xbb\xbf'):
+        return _normalize_text(content[3:].decode('utf-8'))
+    if content.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return _normalize_text(content.decode('utf-16'))
+
+    # Detect the encoding once instead of decode-and-retry
+    if CHARSET_NORMALIZER_AVAILABLE:
+        best = _charset_from_bytes(content).best()
+        if best is not None:
+            return _normalize_text(str(best))
+
+    # Fallback: try common encodings in order
     for encoding in ['utf-8', 'latin-1', 'cp1252']:
         try:
             text = content.decode(encoding)
             return _normalize_text(text)
         except UnicodeDecodeError:
             continue
-    
+
     # Last resort
     return _normalize_text(content.decode('utf-8', errors='ignore'))
 
@@ -52,33 +208,27 @@ def _normalize_text(text: str) -> str:
     - Clean special characters
     """
     # Replace various bullet characters with standard dash
-    text = re.sub(r'[•●○◦▪▫►▻◆◇★☆✓✔✕✖✗✘→]', '-', text)
-    
+    # (single C-level translate pass; no regex engine)
+    text = text.translate(_BULLET_TRANSLATE)
+
     # Normalize whitespace
-    text = re.sub(r'[ \t]+', ' ', text)
-    
+    text = _WS_RE.sub(' ', text)
+
     # Fix multiple newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
+    text = _NL_RE.sub('\n\n', text)
+
     # Remove page numbers
-    text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
-    
-    # Clean up lines
-    lines = []
-    for line in text.split('\n'):
-        line = line.strip()
-        if line:
-            lines.append(line)
-    
-    return '\n'.join(lines)
+    text = _PAGENUM_RE.sub('\n', text)
+
+    # Clean up lines (splitlines handles all line endings in C)
+    return '\n'.join(
+        stripped for line in text.splitlines() if (stripped := line.strip())
+    )
 
 
 def _simple_pdf_extract(content: bytes) -> str:
     """Fallback PDF extraction without pdfplumber."""
-    # Very basic extraction - look for text patterns
-    text = content.decode('latin-1', errors='ignore')
-    
-    # Remove binary noise
-    printable = ''.join(c if c.isprintable() or c in '\n\r\t' else ' ' for c in text)
-    
+    # Remove binary noise with one C-level byte translate, then decode
+    printable = content.translate(_PRINTABLE_TABLE).decode('latin-1', errors='ignore')
+
     return _normalize_text(printable)
@@ -0,0 +1,37 @@
+"""
+Render Plan Service
+
+Pre-normalizes optimized resume sections into render entries so the
+download path (PDF/DOCX) doesn't re-split, strip, and classify every
+line on each request. Built once when optimization completes.
+"""
+
+from typing import Dict, List
+
+
+def build_render_plan(sections: Dict[str, str]) -> Dict[str, List[List[str]]]:
+    """
+    Turn section text into a list of ["bullet"|"para", text] entries.
+
+    Entries are plain lists (not tuples) so the plan survives a JSON
+    round-trip through the Redis/SQLite store backends unchanged.
+    """
+    plan: Dict[str, List[List[str]]] = {}
+
+    for name, content in sections.items():
+        if not content:
+            continue
+
+        entries = []
+        for line in content.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('-'):
+                entries.append(["bullet", line[1:].strip()])
+            else:
+                entries.append(["para", line])
+
+        plan[name] = entries
+
+    return plan
@@ -5,7 +5,10 @@ Rewrites resume content to be ATS-optimized while preserving truth.
 Uses Google Gemini or OpenAI for LLM-powered optimization.
 """
 
+import asyncio
+import json
 import re
+from functools import lru_cache
 from typing import Dict, List
 
 # Optional imports for LLM providers
@@ -21,14 +24,131 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from config import get_settings
 
 settings = get_settings()
 
+# Action verb replacements (weak -> strong)
+_VERB_REPLACEMENTS = {
+    "responsible for": "Managed",
+    "worked on": "Developed",
+    "helped with": "Contributed to",
+    "involved in": "Participated in",
+    "participated in": "Contributed to",
+    "did": "Executed",
+    "made": "Created",
+    "got": "Achieved",
+    "used": "Utilized",
+    "wanted to": "Aimed to",
+    "was part of": "Collaborated on",
+    "handled": "Managed",
+}
+
+# Strong action verbs a bullet may already start with, lowercased once
+_ACTION_VERBS_LOWER = frozenset({
+    "developed", "led", "created", "built", "designed",
+    "implemented", "managed", "achieved", "delivered",
+    "engineered", "architected", "optimized", "streamlined",
+    "spearheaded", "executed", "utilized", "deployed",
+})
+
+# Skill-section splitter and bullet tokenizer, compiled once
+_SKILL_SPLIT_RE = re.compile(r'[\w\s\+#\.]+')
+_TOKEN_RE = re.compile(r'[a-z0-9+.#]+')
+
+# Metrics (percentages, dollar amounts, multipliers) for hallucination checks
+_METRIC_RE = re.compile(r'\d+%|\$[\d,]+|\d+x')
+
+# Summary cleanup patterns: one years regex serves both the search and
+# the removal (via the match span) instead of two separate passes; the
+# second group records whether "experience" was part of the phrase,
+# since only full "N years of experience" phrases get sliced out
+_WS_RE = re.compile(r'\s+')
+_YEARS_RE = re.compile(r'(\d+)\s*\+?\s*years?\s*(?:of\s+)?(experience)?\.?', re.IGNORECASE)
+
+# Match all weak verbs in one automaton pass over the bullet prefix
+# instead of twelve startswith checks per bullet
+_MAX_WEAK_VERB_LEN = max(len(w) for w in _VERB_REPLACEMENTS)
+if AHOCORASICK_AVAILABLE:
+    _WEAK_VERB_AUTOMATON = ahocorasick.Automaton()
+    for _weak, _strong in _VERB_REPLACEMENTS.items():
+        _WEAK_VERB_AUTOMATON.add_word(_weak, (_weak, _strong))
+    _WEAK_VERB_AUTOMATON.make_automaton()
+
 # Initialize Gemini if available
 if GEMINI_AVAILABLE and settings.gemini_api_key:
     genai.configure(api_key=settings.gemini_api_key)
 
+# Shared client/model instances: constructing these per call repeats SDK
+# setup (option parsing, HTTP session) on every bullet, and reusing one
+# OpenAI client keeps its connection pool warm
+_GEMINI_MODEL = (
+    genai.GenerativeModel('gemini-2.0-flash')
+    if GEMINI_AVAILABLE and settings.gemini_api_key
+    else None
+)
+_OPENAI_CLIENT = (
+    OpenAI(api_key=settings.openai_api_key)
+    if OPENAI_AVAILABLE and settings.openai_api_key
+    else None
+)
+
+# Static prompt chunks, rendered once at import. Per-call prompts append
+# only a short volatile tail (the bullet/summary text and keyword list),
+# which avoids rebuilding ~750 bytes of boilerplate per bullet and keeps
+# the stable prefix eligible for provider-side prompt caching.
+_BATCH_PROMPT_RULES = """## BULLET OPTIMIZATION FORMULA (MUST FOLLOW):
+[Strong Action Verb] + [What you did] + [Technology/Skill from keywords] + [Business Impact]
+
+## STRONG ACTION VERBS (use one):
+Technical: Developed, Engineered, Architected, Implemented, Deployed, Optimized, Automated, Integrated
+Leadership: Led, Spearheaded, Directed, Managed, Coordinated, Mentored
+Achievement: Achieved, Delivered, Accelerated, Streamlined, Enhanced, Reduced
+
+## KEYWORD INTEGRATION RULES:
+- If any keyword from the list naturally relates to a bullet, include it
+- Use EXACT keyword phrasing (e.g., "REST APIs" not "RESTful services")
+- Place keyword prominently in the bullet
+
+## TRUTH RULES (CRITICAL):
+- Keep ALL original facts exactly
+- Do NOT invent new metrics or percentages
+- Do NOT add technologies not mentioned in the original
+- If an original has a metric, keep it exactly"""
+
+_BULLET_PROMPT_HEAD = (
+    "You are an ATS optimization expert. Rewrite the bullet point at the end "
+    "to maximize ATS compatibility.\n\n"
+    + _BATCH_PROMPT_RULES
+    + "\n\nReturn ONLY the single rewritten bullet, no dashes, explanations or quotes.\n\n"
+)
+
+_SUMMARY_PROMPT_HEAD = """You are an ATS optimization expert. Rewrite the summary at the end to achieve 90%+ ATS compatibility.
+
+## OPTIMIZATION RULES (FOLLOW EXACTLY):
+
+1. FORMAT: "[Seniority] [Role Title] with [X]+ years of experience in [Primary Keyword]"
+2. KEYWORDS: Include at least 3 keywords naturally from the list above
+3. LENGTH: 2-3 sentences maximum
+4. IMPACT: Mention a key specialization or achievement area
+5. ATS-FRIENDLY: Use standard professional language, no jargon
+
+## TRUTH RULES (NEVER VIOLATE):
+- Keep years of experience EXACTLY as mentioned in original
+- Do NOT invent new skills or achievements
+- Do NOT add metrics that weren't in original
+- Only rephrase existing content
+
+Return ONLY the rewritten summary, no explanations or quotes.
+
+"""
+
 
 def rewrite_resume(
     sections: Dict[str, str],
@@ -37,108 +157,118 @@ def rewrite_resume(
 ) -> Dict[str, str]:
     """
     Rewrite resume sections to be ATS-optimized.
-    
+
     Rules (NON-NEGOTIABLE):
     1. Preserve truth - no invented facts
     2. No new skills, companies, or metrics
     3. Action verb + task + impact format
     4. Plain-text safe
     """
+    return asyncio.run(rewrite_resume_async(sections, jd_data, gaps))
+
+
+async def rewrite_resume_async(
+    sections: Dict[str, str],
+    jd_data: Dict,
+    gaps: Dict,
+) -> Dict[str, str]:
+    """
+    Async rewrite: the summary, experience, and skills rewrites are
+    independent LLM-backed calls, so they run concurrently and the wall
+    time is bounded by the slowest one instead of their sum.
+    """
     optimized = {}
-    
+
     # Rewrite summary
     if sections.get("summary"):
-        optimized["summary"] = _rewrite_summary(
-            sections["summary"],
-            jd_data,
-            gaps,
+        summary_task = asyncio.to_thread(
+            _rewrite_summary, sections["summary"], jd_data, gaps
         )
     else:
-        optimized["summary"] = _generate_summary(sections, jd_data)
-    
+        summary_task = asyncio.to_thread(_generate_summary, sections, jd_data)
+
     # Rewrite experience bullets
     if sections.get("experience"):
-        optimized["experience"] = _rewrite_experience(
-            sections["experience"],
-            jd_data,
-            gaps,
+        experience_task = asyncio.to_thread(
+            _rewrite_experience, sections["experience"], jd_data, gaps
         )
     else:
-        optimized["experience"] = ""
-    
+        experience_task = None
+
     # Rewrite skills section
     if sections.get("skills"):
-        optimized["skills"] = _rewrite_skills(
-            sections["skills"],
-            jd_data,
-        )
+        skills_task = asyncio.to_thread(_rewrite_skills, sections["skills"], jd_data)
     else:
-        optimized["skills"] = ""
-    
+        skills_task = None
+
+    results = await asyncio.gather(
+        summary_task,
+        experience_task if experience_task else asyncio.sleep(0, result=""),
+        skills_task if skills_task else asyncio.sleep(0, result=""),
+    )
+    optimized["summary"], optimized["experience"], optimized["skills"] = results
+
     # Education typically doesn't need rewriting
     optimized["education"] = sections.get("education", "")
-    
+
     # Projects
     if sections.get("projects"):
         optimized["projects"] = sections["projects"]
-    
+
     # Certifications
     if sections.get("certifications"):
         optimized["certifications"] = sections["certifications"]
-    
+
     return optimized
 
 
 def _rewrite_summary(summary: str, jd_data: Dict, gaps: Dict) -> str:
     """Rewrite professional summary using LLM."""
-    target_keywords = jd_data.get("keywords", {}).get("primary", [])[:5]
-    
+    return _rewrite_summary_cached(
+        summary,
+        jd_data.get('role', 'Professional'),
+        jd_data.get('seniority', 'experienced'),
+        tuple(jd_data.get('hard_skills', [])[:5]),
+        tuple(jd_data.get("keywords", {}).get("primary", [])[:5]),
+    )
+
+
+@lru_cache(maxsize=256)
+def _rewrite_summary_cached(
+    summary: str,
+    role: str,
+    seniority: str,
+    hard_skills: tuple,
+    keywords: tuple,
+) -> str:
+    """Dispatch to the configured rewriter; memoized so re-running the
+    same resume against the same JD skips the LLM round-trip."""
     # Try Gemini first (preferred)
     if GEMINI_AVAILABLE and settings.gemini_api_key:
-        return _gemini_rewrite_summary(summary, jd_data, target_keywords)
-    
+        return _gemini_rewrite_summary(summary, role, seniority, hard_skills, keywords)
+
     # Fallback to OpenAI
     if OPENAI_AVAILABLE and settings.openai_api_key:
-        return _llm_rewrite_summary(summary, jd_data, target_keywords)
-    
+        return _llm_rewrite_summary(summary, role, seniority, hard_skills, keywords)
+
     # Rule-based fallback
-    return _rule_based_summary(summary, target_keywords)
+    return _rule_based_summary(summary, keywords)
 
 
-def _gemini_rewrite_summary(summary: str, jd_data: Dict, keywords: List[str]) -> str:
+def _gemini_rewrite_summary(
+    summary: str, role: str, seniority: str, hard_skills: tuple, keywords: tuple
+) -> str:
     """Use Gemini to rewrite summary for 90%+ ATS score."""
     try:
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        
-        role = jd_data.get('role', 'Professional')
-        seniority = jd_data.get('seniority', 'experienced')
-        hard_skills = jd_data.get('hard_skills', [])[:5]
-        
-        prompt = f"""You are an ATS optimization expert. Rewrite this summary to achieve 90%+ ATS compatibility.
-
-ORIGINAL SUMMARY:
-{summary}
-
-TARGET ROLE: {role}
-SENIORITY: {seniority}
-MUST-INCLUDE KEYWORDS: {', '.join(keywords)}
-REQUIRED SKILLS: {', '.join(hard_skills)}
-
-## OPTIMIZATION RULES (FOLLOW EXACTLY):
-
-1. FORMAT: "[Seniority] [Role Title] with [X]+ years of experience in [Primary Keyword]"
-2. KEYWORDS: Include at least 3 keywords naturally from the list above
-3. LENGTH: 2-3 sentences maximum
-4. IMPACT: Mention a key specialization or achievement area
-5. ATS-FRIENDLY: Use standard professional language, no jargon
-
-## TRUTH RULES (NEVER VIOLATE):
-- Keep years of experience EXACTLY as mentioned in original
-- Do NOT invent new skills or achievements
-- Do NOT add metrics that weren't in original
-- Only rephrase existing content
-
-Return ONLY the rewritten summary, no explanations or quotes."""
+        model = _GEMINI_MODEL
+
+        prompt = _SUMMARY_PROMPT_HEAD + (
+            f"TARGET ROLE: {role}\n"
+            f"SENIORITY: {seniority}\n"
+            f"MUST-INCLUDE KEYWORDS: {', '.join(keywords)}\n"
+            f"REQUIRED SKILLS: {', '.join(hard_skills)}\n\n"
+            f"ORIGINAL SUMMARY:\n{summary}"
+        )
 
         response = model.generate_content(prompt)
         result = response.text.strip().strip('"\'')
@@ -148,43 +278,21 @@ Return ONLY the rewritten summary, no explanations or quotes."""
         return _rule_based_summary(summary, keywords)
 
 
-def _llm_rewrite_summary(summary: str, jd_data: Dict, keywords: List[str]) -> str:
+def _llm_rewrite_summary(
+    summary: str, role: str, seniority: str, hard_skills: tuple, keywords: tuple
+) -> str:
     """Use LLM to rewrite summary for 90%+ ATS score."""
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-        
-        role = jd_data.get('role', 'Professional')
-        seniority = jd_data.get('seniority', 'experienced')
-        hard_skills = jd_data.get('hard_skills', [])[:5]
-        
-        prompt = f"""You are an ATS optimization expert. Rewrite this summary to achieve 90%+ ATS compatibility.
-
-ORIGINAL SUMMARY:
-{summary}
-
-TARGET ROLE: {role}
-SENIORITY: {seniority}
-MUST-INCLUDE KEYWORDS: {', '.join(keywords)}
-REQUIRED SKILLS: {', '.join(hard_skills)}
-
-## OPTIMIZATION RULES (FOLLOW EXACTLY):
-
-1. FORMAT: "[Seniority] [Role Title] with [X]+ years of experience in [Primary Keyword]"
-2. KEYWORDS: Include at least 3 keywords naturally from the list above
-3. LENGTH: 2-3 sentences maximum
-4. IMPACT: Mention a key specialization or achievement area
-5. ATS-FRIENDLY: Use standard professional language, no jargon
-
-## TRUTH RULES (NEVER VIOLATE):
-- Keep years of experience EXACTLY as mentioned in original
-- Do NOT invent new skills or achievements
-- Do NOT add metrics that weren't in original
-- Only rephrase existing content
-
-## OUTPUT FORMAT:
-Return ONLY the rewritten summary, no explanations.
-
-OPTIMIZED SUMMARY:"""
+        client = _OPENAI_CLIENT
+
+        prompt = _SUMMARY_PROMPT_HEAD + (
+            f"TARGET ROLE: {role}\n"
+            f"SENIORITY: {seniority}\n"
+            f"MUST-INCLUDE KEYWORDS: {', '.join(keywords)}\n"
+            f"REQUIRED SKILLS: {', '.join(hard_skills)}\n\n"
+            f"ORIGINAL SUMMARY:\n{summary}"
+            + "\n\nOPTIMIZED SUMMARY:"
+        )
         
         response = client.chat.completions.create(
             model="gpt-4o-mini",
@@ -204,71 +312,190 @@ OPTIMIZED SUMMARY:"""
         return _rule_based_summary(summary, keywords)
 
 
-def _rule_based_summary(summary: str, keywords: List[str]) -> str:
+def _rule_based_summary(summary: str, keywords: tuple) -> str:
     """Rule-based summary optimization with keyword integration."""
     # Clean up
-    summary = re.sub(r'\s+', ' ', summary).strip()
-    
-    # Extract years of experience if mentioned
-    years_match = re.search(r'(\d+)\s*(?:\+)?\s*years?', summary, re.IGNORECASE)
-    
-    # Build enhanced summary
-    if keywords and years_match:
-        years = years_match.group(1)
-        # Construct improved summary with keywords
-        relevant_keywords = keywords[:3]
-        keyword_str = ', '.join(relevant_keywords[:-1])
-        if len(relevant_keywords) > 1:
-            keyword_str += f' and {relevant_keywords[-1]}'
-        else:
-            keyword_str = relevant_keywords[0] if relevant_keywords else ''
-        
-        # Get base description without years
-        base = re.sub(r'\d+\s*\+?\s*years?\s*(of\s+)?experience\.?', '', summary, flags=re.IGNORECASE).strip()
-        if base:
-            enhanced = f"Results-driven professional with {years}+ years of experience specializing in {keyword_str}. {base}"
-        else:
-            enhanced = f"Results-driven professional with {years}+ years of experience in {keyword_str}."
-        return enhanced
-    
-    # Ensure it ends with period
-    if summary and not summary.endswith('.'):
-        summary += '.'
-    
-    return summary
+    summary = _WS_RE.sub(' ', summary).strip()
+
+    # Extract years of experience if mentioned; without one (or without
+    # keywords) there is nothing to restructure
+    years_match = _YEARS_RE.search(summary)
+    if not (keywords and years_match):
+        # Ensure it ends with period
+        if summary and not summary.endswith('.'):
+            summary += '.'
+        return summary
+
+    years = years_match.group(1)
+    # Construct improved summary with keywords
+    relevant_keywords = keywords[:3]
+    keyword_str = ', '.join(relevant_keywords[:-1])
+    if len(relevant_keywords) > 1:
+        keyword_str += f' and {relevant_keywords[-1]}'
+    else:
+        keyword_str = relevant_keywords[0] if relevant_keywords else ''
+
+    # Get base description without the years phrase, sliced out via the
+    # match span instead of a second regex pass — but only when the
+    # match covered "experience"; a bare "7 years in fintech" is part of
+    # the body and stays put
+    if years_match.group(2):
+        start, end = years_match.span()
+        base = (summary[:start] + summary[end:]).strip()
+    else:
+        base = summary.strip()
+    if base:
+        return f"Results-driven professional with {years}+ years of experience specializing in {keyword_str}. {base}"
+    return f"Results-driven professional with {years}+ years of experience in {keyword_str}."
 
 
 def _rewrite_experience(experience: str, jd_data: Dict, gaps: Dict) -> str:
     """Rewrite experience bullets."""
     lines = experience.split('\n')
-    rewritten = []
-    
-    target_keywords = set(jd_data.get("keywords", {}).get("primary", []))
-    target_keywords.update(jd_data.get("hard_skills", []))
-    
+
+    # frozenset so the per-bullet cache can key on it
+    target_keywords = frozenset(
+        jd_data.get("keywords", {}).get("primary", [])
+        + jd_data.get("hard_skills", [])
+    )
+
+    # Classify lines first so all bullets can go to the LLM in one call
+    entries = []  # ("bullet", text) or ("header", line)
     for line in lines:
         line = line.strip()
         if not line:
             continue
-        
-        # Check if this is a bullet point (experience description)
-        if line.startswith('-') or re.match(r'^\d+\.', line):
-            # Rewrite bullet
-            bullet = re.sub(r'^[-•]\s*|\d+\.\s*', '', line)
-            rewritten_bullet = _rewrite_bullet(bullet, target_keywords)
-            rewritten.append('- ' + rewritten_bullet)
+
+        # Check if this is a bullet point (experience description).
+        # Tuple startswith plus a cheap digit check keeps the regex
+        # engine out of the common header case
+        if line.startswith(('-', '•', '*')):
+            bullet = line[1:].lstrip()
+            entries.append(("bullet", bullet))
+        elif line[0].isdigit() and line[:3].lstrip('0123456789').startswith('.'):
+            # Numbered list: strip only the "N." marker so digits that
+            # open the text itself ("50% growth") survive
+            bullet = line.lstrip('0123456789').lstrip('.').lstrip()
+            entries.append(("bullet", bullet))
         else:
             # Header or company name - keep as is
-            rewritten.append(line)
-    
+            entries.append(("header", line))
+
+    bullets = [text for kind, text in entries if kind == "bullet"]
+    rewritten_bullets = iter(_rewrite_bullets(bullets, target_keywords))
+
+    rewritten = [
+        '- ' + next(rewritten_bullets) if kind == "bullet" else text
+        for kind, text in entries
+    ]
     return '\n'.join(rewritten)
 
 
-def _rewrite_bullet(bullet: str, target_keywords: set) -> str:
+def _rewrite_bullets(bullets: List[str], target_keywords: frozenset) -> List[str]:
+    """
+    Rewrite a batch of bullets.
+
+    One LLM call carries all bullets (the static prompt instructions are
+    paid once instead of per bullet); falls back to per-bullet calls if
+    the batched response can't be parsed.
+    """
+    # Resumes repeat boilerplate bullets across roles; rewrite each
+    # distinct bullet once and fan the results back out in input order
+    unique = dict.fromkeys(bullets)
+    distinct = list(unique)
+
+    rewritten = None
+    if len(distinct) > 1:
+        if GEMINI_AVAILABLE and settings.gemini_api_key:
+            try:
+                rewritten = _gemini_rewrite_bullets_batch(distinct, target_keywords)
+            except Exception:
+                pass
+
+        if rewritten is None and OPENAI_AVAILABLE and settings.openai_api_key:
+            try:
+                rewritten = _llm_rewrite_bullets_batch(distinct, target_keywords)
+            except Exception:
+                pass
+
+    if rewritten is None:
+        rewritten = [_rewrite_bullet(bullet, target_keywords) for bullet in distinct]
+
+    unique.update(zip(distinct, rewritten))
+    return [unique[b] for b in bullets]
+
+
+def _build_batch_prompt(bullets: List[str], keywords: frozenset) -> str:
+    """Build the one-shot prompt covering every bullet."""
+    payload = json.dumps([{"id": i, "text": b} for i, b in enumerate(bullets)])
+    keywords_list = list(keywords)[:8]
+
+    return f"""You are an ATS optimization expert. Rewrite each bullet point below to maximize ATS compatibility.
+
+BULLETS (JSON): {payload}
+
+TARGET KEYWORDS: {', '.join(keywords_list)}
+
+{_BATCH_PROMPT_RULES}
+
+Return ONLY a JSON array of objects {{"id": <id>, "rewritten": <text>}} covering every input bullet, no explanations."""
+
+
+def _apply_batch_results(bullets: List[str], items: List[Dict]) -> List[str]:
+    """Merge validated batch rewrites back over the originals."""
+    results = list(bullets)
+    for item in items:
+        i = item.get("id")
+        rewritten = (item.get("rewritten") or "").strip().strip('-•').strip().strip('"\'')
+        if isinstance(i, int) and 0 <= i < len(bullets) and rewritten:
+            if _validate_rewrite(bullets[i], rewritten):
+                results[i] = rewritten
+    return results
+
+
+def _gemini_rewrite_bullets_batch(bullets: List[str], keywords: frozenset) -> List[str]:
+    """Rewrite all bullets in one Gemini call."""
+    model = _GEMINI_MODEL
+
+    response = model.generate_content(
+        _build_batch_prompt(bullets, keywords),
+        generation_config={"response_mime_type": "application/json"},
+    )
+    items = json.loads(response.text)
+
+    return _apply_batch_results(bullets, items)
+
+
+def _llm_rewrite_bullets_batch(bullets: List[str], keywords: frozenset) -> List[str]:
+    """Rewrite all bullets in one OpenAI call."""
+    client = _OPENAI_CLIENT
+
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are an ATS expert. Output only the JSON described, nothing else."},
+            {"role": "user", "content": _build_batch_prompt(bullets, keywords)
+             + '\n\nWrap the array as {"bullets": [...]}.'},
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.2,
+    )
+
+    parsed = json.loads(response.choices[0].message.content)
+    items = parsed.get("bullets", parsed) if isinstance(parsed, dict) else parsed
+
+    return _apply_batch_results(bullets, items)
+
+
+@lru_cache(maxsize=1024)
+def _rewrite_bullet(bullet: str, target_keywords: frozenset) -> str:
     """
     Rewrite a single experience bullet.
-    
+
     Format: Action Verb + Task + Impact/Result
+
+    Memoized on (bullet, keywords): duplicate bullets within a resume
+    and re-runs against the same JD skip the LLM round-trip.
     """
     bullet = bullet.strip()
     
@@ -292,36 +519,14 @@ def _rewrite_bullet(bullet: str, target_keywords: set) -> str:
 
 def _gemini_rewrite_bullet(bullet: str, keywords: set) -> str:
     """Use Gemini to rewrite bullet for 90%+ ATS score."""
-    model = genai.GenerativeModel('gemini-2.0-flash')
+    model = _GEMINI_MODEL
     
     keywords_list = list(keywords)[:8]
     
-    prompt = f"""You are an ATS optimization expert. Rewrite this bullet point to maximize ATS compatibility.
-
-ORIGINAL BULLET: {bullet}
-
-TARGET KEYWORDS: {', '.join(keywords_list)}
-
-## BULLET OPTIMIZATION FORMULA (MUST FOLLOW):
-[Strong Action Verb] + [What you did] + [Technology/Skill from keywords] + [Business Impact]
-
-## STRONG ACTION VERBS (use one):
-Technical: Developed, Engineered, Architected, Implemented, Deployed, Optimized, Automated, Integrated
-Leadership: Led, Spearheaded, Directed, Managed, Coordinated, Mentored
-Achievement: Achieved, Delivered, Accelerated, Streamlined, Enhanced, Reduced
-
-## KEYWORD INTEGRATION RULES:
-- If any keyword from the list naturally relates to this bullet, include it
-- Use EXACT keyword phrasing (e.g., "REST APIs" not "RESTful services")
-- Place keyword prominently in the bullet
-
-## TRUTH RULES (CRITICAL):
-- Keep ALL original facts exactly
-- Do NOT invent new metrics or percentages
-- Do NOT add technologies not mentioned in original
-- If original has a metric, keep it exactly
-
-Return ONLY the single rewritten bullet, no dashes, explanations or quotes."""
+    prompt = _BULLET_PROMPT_HEAD + (
+        f"TARGET KEYWORDS: {', '.join(keywords_list)}\n\n"
+        f"ORIGINAL BULLET: {bullet}"
+    )
 
     response = model.generate_content(prompt)
     rewritten = response.text.strip().strip('-•').strip().strip('"\'')
@@ -334,39 +539,15 @@ Return ONLY the single rewritten bullet, no dashes, explanations or quotes."""
 
 def _llm_rewrite_bullet(bullet: str, keywords: set) -> str:
     """Use LLM to rewrite bullet for 90%+ ATS score."""
-    client = OpenAI(api_key=settings.openai_api_key)
+    client = _OPENAI_CLIENT
     
     keywords_list = list(keywords)[:8]
     
-    prompt = f"""You are an ATS optimization expert. Rewrite this bullet point to maximize ATS compatibility.
-
-ORIGINAL BULLET: {bullet}
-
-TARGET KEYWORDS: {', '.join(keywords_list)}
-
-## BULLET OPTIMIZATION FORMULA (MUST FOLLOW):
-[Strong Action Verb] + [What you did] + [Technology/Skill from keywords] + [Business Impact]
-
-## STRONG ACTION VERBS (use one):
-Technical: Developed, Engineered, Architected, Implemented, Deployed, Optimized, Automated, Integrated
-Leadership: Led, Spearheaded, Directed, Managed, Coordinated, Mentored
-Achievement: Achieved, Delivered, Accelerated, Streamlined, Enhanced, Reduced
-
-## KEYWORD INTEGRATION RULES:
-- If any keyword from the list naturally relates to this bullet, include it
-- Use EXACT keyword phrasing (e.g., "REST APIs" not "RESTful services")
-- Place keyword prominently in the bullet
-
-## TRUTH RULES (CRITICAL):
-- Keep ALL original facts exactly
-- Do NOT invent new metrics or percentages
-- Do NOT add technologies not mentioned in original
-- If original has a metric, keep it exactly
-
-## OUTPUT:
-Return ONLY the single rewritten bullet, no dashes, explanations or quotes.
-
-OPTIMIZED BULLET:"""
+    prompt = _BULLET_PROMPT_HEAD + (
+        f"TARGET KEYWORDS: {', '.join(keywords_list)}\n\n"
+        f"ORIGINAL BULLET: {bullet}"
+        + "\n\nOPTIMIZED BULLET:"
+    )
     
     response = client.chat.completions.create(
         model="gpt-4o-mini",
@@ -391,51 +572,41 @@ OPTIMIZED BULLET:"""
 def _rule_based_bullet(bullet: str, keywords: set) -> str:
     """Enhanced rule-based bullet optimization with keyword integration."""
     original = bullet.strip()
-    
-    # Action verb replacements (weak -> strong)
-    verb_replacements = {
-        "responsible for": "Managed",
-        "worked on": "Developed",
-        "helped with": "Contributed to",
-        "involved in": "Participated in",
-        "participated in": "Contributed to",
-        "did": "Executed",
-        "made": "Created",
-        "got": "Achieved",
-        "used": "Utilized",
-        "wanted to": "Aimed to",
-        "was part of": "Collaborated on",
-        "handled": "Managed",
-    }
-    
+
     bullet_lower = bullet.lower()
-    for weak, strong in verb_replacements.items():
-        if bullet_lower.startswith(weak):
-            bullet = strong + bullet[len(weak):]
-            break
+    weak, strong = _match_weak_verb(bullet_lower)
+    if weak:
+        bullet = strong + bullet[len(weak):]
     
     # If still doesn't start with action verb, try to restructure
-    action_verbs = ["Developed", "Led", "Created", "Built", "Designed", 
-                    "Implemented", "Managed", "Achieved", "Delivered",
-                    "Engineered", "Architected", "Optimized", "Streamlined",
-                    "Spearheaded", "Executed", "Utilized", "Deployed"]
-    
-    first_word = bullet.split()[0] if bullet.split() else ""
-    
-    # Check if starts with action verb
-    starts_with_action = first_word.lower() in [v.lower() for v in action_verbs]
+    words = bullet.split(None, 1)
+    first_word = words[0] if words else ""
+
+    # Check if starts with action verb (O(1) frozenset lookup)
+    starts_with_action = first_word.lower() in _ACTION_VERBS_LOWER
     
     if not starts_with_action:
-        # Try to find a relevant keyword to enhance with
-        for keyword in keywords:
-            if keyword.lower() in bullet_lower:
-                # The bullet already mentions a relevant skill, enhance it
-                bullet = f"Utilized {keyword} expertise to {bullet[0].lower()}{bullet[1:]}"
-                break
+        # Try to find a relevant keyword to enhance with: single-word
+        # keywords hit via one set intersection, multi-word ones via
+        # substring check
+        bullet_tokens = set(_TOKEN_RE.findall(bullet_lower))
+        single_word = {k.lower(): k for k in keywords if ' ' not in k}
+        matched_tokens = bullet_tokens & single_word.keys()
+
+        if matched_tokens:
+            keyword = single_word[next(iter(matched_tokens))]
         else:
+            keyword = next(
+                (k for k in keywords if ' ' in k and k.lower() in bullet_lower),
+                None,
+            )
+
+        if keyword:
+            # The bullet already mentions a relevant skill, enhance it
+            bullet = f"Utilized {keyword} expertise to {bullet[0].lower()}{bullet[1:]}"
+        elif bullet:
             # No keyword found, add generic action verb
-            if bullet and not starts_with_action:
-                bullet = f"Developed {bullet[0].lower()}{bullet[1:]}"
+            bullet = f"Developed {bullet[0].lower()}{bullet[1:]}"
     
     # Capitalize first letter
     if bullet:
@@ -444,6 +615,30 @@ def _rule_based_bullet(bullet: str, keywords: set) -> str:
     return bullet
 
 
+def _match_weak_verb(bullet_lower: str) -> tuple:
+    """
+    Find the weak verb the bullet starts with, if any.
+
+    Returns (weak, strong) or (None, None). Uses the Aho-Corasick
+    automaton over just the bullet prefix when available, otherwise the
+    plain startswith loop.
+    """
+    if AHOCORASICK_AVAILABLE:
+        best = (None, None)
+        for end, (weak, strong) in _WEAK_VERB_AUTOMATON.iter(
+            bullet_lower[:_MAX_WEAK_VERB_LEN]
+        ):
+            # Only matches anchored at the start of the bullet count
+            if end == len(weak) - 1 and (best[0] is None or len(weak) > len(best[0])):
+                best = (weak, strong)
+        return best
+
+    for weak, strong in _VERB_REPLACEMENTS.items():
+        if bullet_lower.startswith(weak):
+            return weak, strong
+    return None, None
+
+
 def _validate_rewrite(original: str, rewritten: str) -> bool:
     """
     Validate that rewrite doesn't hallucinate.
@@ -453,35 +648,37 @@ def _validate_rewrite(original: str, rewritten: str) -> bool:
     - No new company names added
     - Similar length (not wildly different)
     """
-    # Check for new metrics
-    orig_numbers = set(re.findall(r'\d+%|\$[\d,]+|\d+x', original))
-    new_numbers = set(re.findall(r'\d+%|\$[\d,]+|\d+x', rewritten))
-    
-    # If new numbers appeared that weren't in original, reject
-    added_numbers = new_numbers - orig_numbers
-    if added_numbers:
-        return False
-    
-    # Length check - shouldn't be more than 2x longer
+    # Length check first - shouldn't be more than 2x longer
     if len(rewritten) > len(original) * 2:
         return False
-    
-    return True
+
+    # No digits in the rewrite means no new metrics are possible;
+    # skip the regex scans entirely (the common case)
+    if not any(c.isdigit() for c in rewritten):
+        return True
+
+    # Check for new metrics
+    orig_numbers = set(_METRIC_RE.findall(original))
+    new_numbers = set(_METRIC_RE.findall(rewritten))
+
+    # If new numbers appeared that weren't in original, reject
+    return not (new_numbers - orig_numbers)
 
 
 def _rewrite_skills(skills: str, jd_data: Dict) -> str:
     """Rewrite skills section to prioritize relevant skills."""
     # Extract current skills
-    skill_list = re.findall(r'[\w\s\+#\.]+', skills)
+    skill_list = _SKILL_SPLIT_RE.findall(skills)
     skill_list = [s.strip() for s in skill_list if s.strip() and len(s.strip()) > 1]
-    
-    # Target skills from JD
-    target_skills = set(jd_data.get("hard_skills", []))
-    target_skills.update(jd_data.get("keywords", {}).get("primary", []))
-    
+
+    # Target skills from JD, lowercased once
+    target_lower = {t.lower() for t in jd_data.get("hard_skills", [])}
+    target_lower.update(t.lower() for t in jd_data.get("keywords", {}).get("primary", []))
+
     # Prioritize matching skills
-    matching = [s for s in skill_list if s.lower() in [t.lower() for t in target_skills]]
-    other = [s for s in skill_list if s not in matching]
+    matching = [s for s in skill_list if s.lower() in target_lower]
+    matching_set = set(matching)
+    other = [s for s in skill_list if s not in matching_set]
     
     # Reorder: matching skills first
     reordered = matching + other
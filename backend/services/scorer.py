@@ -4,8 +4,113 @@ ATS Scoring Service
 Calculates ATS compatibility score for a resume.
 """
 
+import hashlib
 import re
-from typing import Dict, List, Set
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Scoring patterns, compiled once at import (these run on every request;
+# going through re's per-call cache re-hashes the pattern string each time)
+_SPECIAL_CHARS_SET = frozenset('│║╔╗╚╝═─┌┐└┘├┤┬┴┼')
+_IMAGE_TABLE_RE = re.compile(r'\[image\]|\[table\]', re.IGNORECASE)
+_ACTION_VERBS = frozenset({
+    "led", "developed", "built", "created", "managed", "designed",
+    "implemented", "achieved", "increased", "reduced", "delivered",
+    "launched", "optimized",
+})
+_WORD_RE = re.compile(r'[a-z]+')
+_METRICS_RE = re.compile(r'\d+%|\$[\d,]+|\d+ (users|customers|projects|team members)', re.IGNORECASE)
+
+# Tokenizer for the keyword fallback path (keeps c++, c#, .net intact)
+_TOKEN_RE = re.compile(r'[a-z0-9+.#]+')
+
+
+@dataclass(slots=True)
+class _SectionView:
+    """Per-section facts computed once (text, length, substance check)."""
+    name: str
+    text: str
+    length: int
+    has_content: bool
+
+
+@dataclass(slots=True)
+class _ScoringContext:
+    """
+    Per-request view of the resume text.
+
+    Built once in calculate_ats_score and shared by the scorers, so the
+    joined text, its lowered copy, the word count, the experience
+    section, and the per-section views are each computed a single time
+    instead of per scorer.
+    """
+    sections: Dict[str, str]
+    views: Dict[str, _SectionView]
+    all_text: str
+    all_text_lower: str
+    word_count: int
+    experience: str
+
+
+def _build_context(sections: Dict[str, str]) -> _ScoringContext:
+    all_text = ' '.join(sections.values())
+    return _ScoringContext(
+        sections=sections,
+        views={
+            name: _SectionView(name, text, len(text), len(text) > 20)
+            for name, text in sections.items()
+        },
+        all_text=all_text,
+        all_text_lower=all_text.lower(),
+        # maxsplit caps the list at 1501 entries — enough to tell the
+        # <200 / 200-1500 / >1500 bands apart without allocating a word
+        # list proportional to pathological input
+        word_count=len(all_text.split(None, 1500)),
+        experience=sections.get("experience", ""),
+    )
+
+
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords: frozenset):
+    """
+    Build (and memoize) an Aho-Corasick automaton over lowered keywords.
+
+    One automaton walk over the resume finds every keyword in a single
+    pass instead of one full-text substring scan per keyword; the cache
+    means re-scoring against the same JD reuses the built automaton.
+    """
+    automaton = ahocorasick.Automaton()
+    for lowered in keywords:
+        automaton.add_word(lowered, lowered)
+    automaton.make_automaton()
+    return automaton
+
+
+# Scoring is deterministic in (sections, JD keywords); re-running the
+# same resume against the same JD skips all regex work via this cache
+_score_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+_SCORE_CACHE_MAX = 2048
+
+
+def _score_cache_key(resume_sections: Dict[str, str], jd_data: Dict) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(resume_sections):
+        digest.update(name.encode())
+        digest.update(resume_sections[name].encode())
+    keywords = jd_data.get("keywords", {})
+    for group in (keywords.get("primary", []), keywords.get("secondary", []),
+                  jd_data.get("hard_skills", [])):
+        digest.update('\x00'.join(sorted(group)).encode())
+        digest.update(b'\x01')
+    return digest.digest()
 
 
 def calculate_ats_score(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
@@ -18,28 +123,58 @@ def calculate_ats_score(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
     - Format compatibility (20%)
     - Content quality (20%)
     """
+    key = _score_cache_key(resume_sections, jd_data)
+    cached = _score_cache.get(key)
+    if cached is not None:
+        _score_cache.move_to_end(key)
+        return {
+            "score": cached["score"],
+            "breakdown": dict(cached["breakdown"]),
+            "improvements": list(cached["improvements"]),
+            "remaining_gaps": list(cached["remaining_gaps"]),
+        }
+
+    result = _calculate_ats_score_uncached(resume_sections, jd_data)
+
+    _score_cache[key] = result
+    if len(_score_cache) > _SCORE_CACHE_MAX:
+        _score_cache.popitem(last=False)
+    return result
+
+
+def _calculate_ats_score_uncached(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
+    """Run the actual scorers (see calculate_ats_score for the cache)."""
     scores = {}
-    improvements = []
-    
+    # Each scorer hands back its positives and negatives already split,
+    # so no re-scan of the combined list for "+"/"-" prefixes is needed
+    positives: List[str] = []
+    negatives: List[str] = []
+
+    ctx = _build_context(resume_sections)
+
     # 1. Keyword match (40%)
-    keyword_score, keyword_details = _score_keywords(resume_sections, jd_data)
+    keyword_score, pos, neg = _score_keywords(ctx, jd_data)
     scores["keywords"] = keyword_score
-    improvements.extend(keyword_details)
+    positives += pos
+    negatives += neg
     
     # 2. Section completeness (20%)
-    section_score, section_details = _score_sections(resume_sections)
+    section_score, pos, neg = _score_sections(ctx)
     scores["sections"] = section_score
-    improvements.extend(section_details)
+    positives += pos
+    negatives += neg
     
     # 3. Format compatibility (20%)
-    format_score, format_details = _score_format(resume_sections)
+    format_score, pos, neg = _score_format(ctx)
     scores["format"] = format_score
-    improvements.extend(format_details)
+    positives += pos
+    negatives += neg
     
     # 4. Content quality (20%)
-    quality_score, quality_details = _score_quality(resume_sections)
+    quality_score, pos, neg = _score_quality(ctx)
     scores["quality"] = quality_score
-    improvements.extend(quality_details)
+    positives += pos
+    negatives += neg
     
     # Calculate weighted total
     total_score = (
@@ -52,136 +187,164 @@ def calculate_ats_score(resume_sections: Dict[str, str], jd_data: Dict) -> Dict:
     return {
         "score": round(total_score),
         "breakdown": scores,
-        "improvements": [i for i in improvements if i.startswith("+")],
-        "remaining_gaps": [i for i in improvements if i.startswith("-")],
+        "improvements": positives,
+        "remaining_gaps": negatives,
     }
 
 
-def _score_keywords(sections: Dict[str, str], jd_data: Dict) -> tuple:
+def _score_keywords(ctx: _ScoringContext, jd_data: Dict) -> Tuple[int, List[str], List[str]]:
     """Score keyword matching."""
-    all_text = ' '.join(sections.values()).lower()
-    
-    # Get target keywords
-    primary = jd_data.get("keywords", {}).get("primary", [])
-    secondary = jd_data.get("keywords", {}).get("secondary", [])
-    hard_skills = jd_data.get("hard_skills", [])
+    all_text = ctx.all_text_lower
     
-    all_keywords = set(primary + secondary + hard_skills)
-    
-    if not all_keywords:
-        return 100, []
+    # Get target keywords, canonicalized once: dedupe case-insensitively
+    # and lower each keyword a single time (starred unpacking avoids the
+    # intermediate concatenated list)
+    keywords = jd_data.get("keywords", {})
+    lower_to_orig: Dict[str, str] = {}
+    for keyword in (*keywords.get("primary", []), *keywords.get("secondary", []),
+                    *jd_data.get("hard_skills", [])):
+        lower_to_orig.setdefault(keyword.lower(), keyword)
+
+    if not lower_to_orig:
+        return 100, [], []
     
     # Count matches
-    matched = 0
-    matched_keywords = []
-    missing_keywords = []
-    
-    for keyword in all_keywords:
-        if keyword.lower() in all_text:
-            matched += 1
-            matched_keywords.append(keyword)
-        else:
-            missing_keywords.append(keyword)
-    
-    score = int((matched / len(all_keywords)) * 100)
-    
-    details = []
+    matched_keywords: List[str] = []
+    missing_keywords: List[str] = []
+
+    # Bind the append methods once; on large keyword sets the repeated
+    # attribute lookups inside the loop are measurable interpreter cost
+    add_match = matched_keywords.append
+    add_miss = missing_keywords.append
+
+    if AHOCORASICK_AVAILABLE:
+        # Single pass over the text reports every keyword hit at once
+        automaton = _keyword_automaton(frozenset(lower_to_orig))
+        found = {lowered for _, lowered in automaton.iter(all_text)}
+        for lowered, orig in lower_to_orig.items():
+            if lowered in found:
+                add_match(orig)
+            else:
+                add_miss(orig)
+    else:
+        # Hybrid fallback: tokenize the resume once so single-word
+        # keywords (the dominant case) resolve with one O(1) set lookup;
+        # only multi-word keywords still substring-scan the text
+        tokens = set(_TOKEN_RE.findall(all_text))
+        for lowered, orig in lower_to_orig.items():
+            hit = lowered in tokens if ' ' not in lowered else lowered in all_text
+            if hit:
+                add_match(orig)
+            else:
+                add_miss(orig)
+
+    score = int((len(matched_keywords) / len(lower_to_orig)) * 100)
+
+    positives: List[str] = []
+    negatives: List[str] = []
     if matched_keywords:
-        details.append(f"+ Matched {len(matched_keywords)} keywords: {', '.join(matched_keywords[:5])}")
+        positives.append(f"+ Matched {len(matched_keywords)} keywords: {', '.join(matched_keywords[:5])}")
     if missing_keywords:
-        details.append(f"- Missing keywords: {', '.join(missing_keywords[:5])}")
-    
-    return score, details
+        negatives.append(f"- Missing keywords: {', '.join(missing_keywords[:5])}")
+
+    return score, positives, negatives
 
 
-def _score_sections(sections: Dict[str, str]) -> tuple:
+def _score_sections(ctx: _ScoringContext) -> Tuple[int, List[str], List[str]]:
     """Score section completeness."""
     required = ["summary", "experience", "skills", "education"]
     present = 0
-    details = []
-    
+    positives: List[str] = []
+    negatives: List[str] = []
+    views = ctx.views
+
     for section in required:
-        if sections.get(section) and len(sections[section]) > 20:
+        view = views.get(section)
+        if view is not None and view.has_content:
             present += 1
-            details.append(f"+ {section.title()} section present")
+            positives.append(f"+ {section.title()} section present")
         else:
-            details.append(f"- Missing or empty {section.title()} section")
+            negatives.append(f"- Missing or empty {section.title()} section")
     
     score = int((present / len(required)) * 100)
-    return score, details
+    return score, positives, negatives
 
 
-def _score_format(sections: Dict[str, str]) -> tuple:
+def _score_format(ctx: _ScoringContext) -> Tuple[int, List[str], List[str]]:
     """Score ATS format compatibility."""
-    all_text = ' '.join(sections.values())
+    all_text = ctx.all_text
     score = 100
-    details = []
+    positives: List[str] = []
+    negatives: List[str] = []
     
-    # Check for problematic characters
-    special_chars = re.findall(r'[│║╔╗╚╝═─┌┐└┘├┤┬┴┼]', all_text)
-    if special_chars:
+    # Check for problematic characters: isdisjoint iterates the text in
+    # C and exits on the first offending char, no regex engine involved
+    if not _SPECIAL_CHARS_SET.isdisjoint(all_text):
         score -= 20
-        details.append("- Contains special characters that may break ATS parsing")
+        negatives.append("- Contains special characters that may break ATS parsing")
     else:
-        details.append("+ No problematic special characters")
+        positives.append("+ No problematic special characters")
     
     # Check for images/tables indicators
-    if re.search(r'\[image\]|\[table\]', all_text, re.I):
+    if _IMAGE_TABLE_RE.search(all_text):
         score -= 15
-        details.append("- Contains images or tables (not ATS-friendly)")
+        negatives.append("- Contains images or tables (not ATS-friendly)")
     
     # Check for reasonable length
-    word_count = len(all_text.split())
+    word_count = ctx.word_count
     if word_count < 200:
         score -= 15
-        details.append("- Resume too short (under 200 words)")
+        negatives.append("- Resume too short (under 200 words)")
     elif word_count > 1500:
         score -= 10
-        details.append("- Resume may be too long (over 1500 words)")
+        negatives.append("- Resume may be too long (over 1500 words)")
     else:
-        details.append("+ Good resume length")
+        positives.append("+ Good resume length")
     
-    return max(0, score), details
+    return max(0, score), positives, negatives
 
 
-def _score_quality(sections: Dict[str, str]) -> tuple:
+def _score_quality(ctx: _ScoringContext) -> Tuple[int, List[str], List[str]]:
     """Score content quality."""
-    experience = sections.get("experience", "")
+    experience = ctx.experience
     score = 100
-    details = []
+    positives: List[str] = []
+    negatives: List[str] = []
     
     if not experience:
-        return 50, ["- No experience section to evaluate"]
+        return 50, [], ["- No experience section to evaluate"]
     
-    # Check for action verbs
-    action_verbs = r'\b(led|developed|built|created|managed|designed|implemented|achieved|increased|reduced|delivered|launched|optimized)\b'
-    action_count = len(re.findall(action_verbs, experience, re.I))
+    # Check for action verbs: tokenize once and count set hits instead
+    # of walking a 13-way case-insensitive alternation over the text
+    action_count = sum(
+        1 for t in _WORD_RE.findall(experience.lower()) if t in _ACTION_VERBS
+    )
     
     if action_count >= 5:
-        details.append(f"+ Strong use of action verbs ({action_count} found)")
+        positives.append(f"+ Strong use of action verbs ({action_count} found)")
     elif action_count >= 2:
-        details.append(f"+ Some action verbs used ({action_count} found)")
+        positives.append(f"+ Some action verbs used ({action_count} found)")
         score -= 10
     else:
-        details.append("- Few action verbs - bullets may be weak")
+        negatives.append("- Few action verbs - bullets may be weak")
         score -= 25
     
     # Check for metrics
-    metrics = re.findall(r'\d+%|\$[\d,]+|\d+ (users|customers|projects|team members)', experience, re.I)
-    
-    if metrics:
-        details.append(f"+ Contains quantifiable achievements ({len(metrics)} metrics)")
+    metric_count = sum(1 for _ in _METRICS_RE.finditer(experience))
+
+    if metric_count:
+        positives.append(f"+ Contains quantifiable achievements ({metric_count} metrics)")
     else:
-        details.append("- No metrics/numbers to quantify impact")
+        negatives.append("- No metrics/numbers to quantify impact")
         score -= 20
     
-    # Check for bullet points
-    bullet_count = len(re.findall(r'\n[-•]\s', experience))
+    # Check for bullet points: two C-level substring counts, no regex
+    bullet_count = experience.count('\n- ') + experience.count('\n• ')
     
     if bullet_count >= 5:
-        details.append(f"+ Well-structured with {bullet_count} bullet points")
+        positives.append(f"+ Well-structured with {bullet_count} bullet points")
     else:
-        details.append("- Could use more bullet points for readability")
+        negatives.append("- Could use more bullet points for readability")
         score -= 10
     
-    return max(0, score), details
+    return max(0, score), positives, negatives
@@ -0,0 +1,164 @@
+"""
+Key-Value Store Service
+
+Pluggable storage for resumes, JDs, and jobs. The default in-memory
+backend keeps the single-process MVP behavior; the Redis and SQLite
+backends allow multi-worker deployment, bounded memory (TTL eviction),
+and persistence across restarts.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from config import get_settings
+
+settings = get_settings()
+
+# Optional Redis client
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class KVStore:
+    """
+    Dict-like key-value store interface.
+
+    Values must be JSON-serializable. Entries expire after `ttl_seconds`.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: int):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+
+class MemoryStore(KVStore):
+    """Process-local store. Fast, but single-worker and lost on restart."""
+
+    def __init__(self, namespace: str, ttl_seconds: int):
+        super().__init__(namespace, ttl_seconds)
+        self._data: dict = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (value, time.monotonic() + self.ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RedisStore(KVStore):
+    """Redis-backed store. Shared across workers, TTL handled by Redis."""
+
+    def __init__(self, namespace: str, ttl_seconds: int):
+        super().__init__(namespace, ttl_seconds)
+        self._client = redis.Redis.from_url(settings.redis_url)
+
+    def _key(self, key: str) -> str:
+        return f"ats:{self.namespace}:{key}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            return default
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        self._client.set(self._key(key), json.dumps(value), ex=self.ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._key(key))
+
+
+class SqliteStore(KVStore):
+    """SQLite-backed store. Single-host persistence without a Redis server."""
+
+    def __init__(self, namespace: str, ttl_seconds: int):
+        super().__init__(namespace, ttl_seconds)
+        path = settings.database_url.replace("sqlite:///", "", 1)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv_store ("
+                "namespace TEXT, key TEXT, value TEXT, expires_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM kv_store WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        if row is None or time.time() > row[1]:
+            return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv_store (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), time.time() + self.ttl_seconds),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM kv_store WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+            self._conn.commit()
+
+
+def get_store(namespace: str) -> KVStore:
+    """Build the configured store backend for a namespace."""
+    ttl_seconds = settings.store_ttl_hours * 3600
+
+    if settings.store_backend == "redis":
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("store_backend=redis but the redis package is not installed")
+        return RedisStore(namespace, ttl_seconds)
+
+    if settings.store_backend == "sqlite":
+        return SqliteStore(namespace, ttl_seconds)
+
+    return MemoryStore(namespace, ttl_seconds)
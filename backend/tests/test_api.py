@@ -8,6 +8,63 @@ from main import app
 
 client = TestClient(app)
 
+# Shared resume/JD for the read-only tests below; uploaded and optimized
+# once per module so the parse/extract/score pipeline isn't re-run by
+# every test that only inspects the result
+SHARED_RESUME_TEXT = """
+SUMMARY
+Senior Python developer with FastAPI and AWS experience.
+
+EXPERIENCE
+Lead Developer (2020-2024)
+- Developed REST APIs using Python and FastAPI
+- Deployed applications on AWS using Docker
+- Managed PostgreSQL databases
+- Led Agile development process
+
+SKILLS
+Python, FastAPI, PostgreSQL, Docker, AWS, Kubernetes
+
+EDUCATION
+MS Computer Science
+"""
+
+SHARED_JD_TEXT = """
+Senior Python Developer
+
+Requirements:
+Python, FastAPI, PostgreSQL, Docker, AWS
+
+You will build scalable APIs and deploy to cloud.
+""" + " " * 100
+
+
+@pytest.fixture(scope="module")
+def uploaded_resume():
+    """Upload the shared resume once per module."""
+    response = client.post("/api/resume/upload", data={"text": SHARED_RESUME_TEXT})
+    assert response.status_code == 200
+    return response.json()["resume_id"]
+
+
+@pytest.fixture(scope="module")
+def extracted_jd():
+    """Extract the shared JD once per module."""
+    response = client.post("/api/jd/extract", json={"text": SHARED_JD_TEXT})
+    assert response.status_code == 200
+    return response.json()["jd_id"]
+
+
+@pytest.fixture(scope="module")
+def optimized_job(uploaded_resume, extracted_jd):
+    """Run the shared resume/JD optimization once per module."""
+    response = client.post(
+        "/api/optimize",
+        json={"resume_id": uploaded_resume, "jd_id": extracted_jd},
+    )
+    assert response.status_code == 200
+    return response.json()["job_id"]
+
 
 class TestHealthEndpoints:
     """Test health check endpoints."""
@@ -302,48 +359,9 @@ class TestJDIntelligence:
 class TestATSScoring:
     """Test ATS scoring algorithm."""
     
-    def test_high_match_gets_high_score(self):
+    def test_high_match_gets_high_score(self, optimized_job):
         """Test that matching resume gets high score."""
-        # Resume with matching skills
-        resume_text = """
-        SUMMARY
-        Senior Python developer with FastAPI and AWS experience.
-        
-        EXPERIENCE
-        Lead Developer (2020-2024)
-        - Developed REST APIs using Python and FastAPI
-        - Deployed applications on AWS using Docker
-        - Managed PostgreSQL databases
-        - Led Agile development process
-        
-        SKILLS
-        Python, FastAPI, PostgreSQL, Docker, AWS, Kubernetes
-        
-        EDUCATION
-        MS Computer Science
-        """
-        
-        # JD with same skills
-        jd_text = """
-        Senior Python Developer
-        
-        Requirements:
-        Python, FastAPI, PostgreSQL, Docker, AWS
-        
-        You will build scalable APIs and deploy to cloud.
-        """ + " " * 100
-        
-        # Upload and optimize
-        resume_resp = client.post("/api/resume/upload", data={"text": resume_text})
-        jd_resp = client.post("/api/jd/extract", json={"text": jd_text})
-        
-        optimize_resp = client.post("/api/optimize", json={
-            "resume_id": resume_resp.json()["resume_id"],
-            "jd_id": jd_resp.json()["jd_id"]
-        })
-        
-        job_id = optimize_resp.json()["job_id"]
-        result = client.get(f"/api/job/{job_id}/result").json()
+        result = client.get(f"/api/job/{optimized_job}/result").json()
         
         # Should have decent score with matching skills
         assert result["ats_score"] >= 50
@@ -352,39 +370,11 @@ class TestATSScoring:
 class TestDownloadEndpoints:
     """Test resume download/export endpoints."""
     
-    def test_download_resume_text(self):
+    def test_download_resume_text(self, optimized_job):
         """Test downloading resume as text."""
-        # Create optimization first
-        resume_text = """
-        SUMMARY
-        Software developer with Python experience.
-        
-        EXPERIENCE
-        Developer (2020-2024)
-        - Built REST APIs
-        
-        SKILLS
-        Python, SQL
-        
-        EDUCATION
-        BS CS
-        """
-        
-        jd_text = "Python Developer position available. Requirements: Python programming, SQL databases, AWS cloud services required. Build scalable backend systems."
-        
-        resume_resp = client.post("/api/resume/upload", data={"text": resume_text})
-        jd_resp = client.post("/api/jd/extract", json={"text": jd_text})
-        
-        optimize_resp = client.post("/api/optimize", json={
-            "resume_id": resume_resp.json()["resume_id"],
-            "jd_id": jd_resp.json()["jd_id"]
-        })
-        
-        job_id = optimize_resp.json()["job_id"]
-        
         # Download as PDF (default)
         download_resp = client.post("/api/resume/download", json={
-            "job_id": job_id,
+            "job_id": optimized_job,
             "format": "pdf"
         })
         
@@ -393,38 +383,10 @@ class TestDownloadEndpoints:
         # PDF files start with %PDF
         assert download_resp.content[:4] == b'%PDF'
     
-    def test_download_resume_docx(self):
+    def test_download_resume_docx(self, optimized_job):
         """Test downloading resume as DOCX."""
-        resume_text = """
-        SUMMARY
-        Developer with experience.
-        
-        SKILLS
-        Python, Java
-        
-        EXPERIENCE
-        Dev (2020-2024)
-        - Coded stuff
-        
-        EDUCATION
-        BS
-        """
-        
-        jd_text = "Software Engineer position. Python required for backend development. Build distributed systems and microservices architecture."
-        
-        resume_resp = client.post("/api/resume/upload", data={"text": resume_text})
-        jd_resp = client.post("/api/jd/extract", json={"text": jd_text})
-        
-        optimize_resp = client.post("/api/optimize", json={
-            "resume_id": resume_resp.json()["resume_id"],
-            "jd_id": jd_resp.json()["jd_id"]
-        })
-        
-        job_id = optimize_resp.json()["job_id"]
-        
-        # Download as DOCX
         download_resp = client.post("/api/resume/download", json={
-            "job_id": job_id,
+            "job_id": optimized_job,
             "format": "docx"
         })
         
@@ -433,33 +395,11 @@ class TestDownloadEndpoints:
         # DOCX files are ZIP archives starting with PK
         assert download_resp.content[:2] == b'PK'
     
-    def test_get_formatted_resume(self):
+    def test_get_formatted_resume(self, uploaded_resume, extracted_jd):
         """Test getting formatted resume with keywords."""
-        resume_text = """
-        SUMMARY
-        Python developer.
-        
-        SKILLS
-        Python, AWS
-        
-        EXPERIENCE
-        Dev at Company
-        - Built APIs
-        
-        EDUCATION
-        BS
-        """
-        
-        jd_text = "Python Developer with AWS cloud experience. Build scalable distributed systems. Must have experience with backend development and API design."
-        
-        resume_resp = client.post("/api/resume/upload", data={"text": resume_text})
-        resume_id = resume_resp.json()["resume_id"]
-        
-        jd_resp = client.post("/api/jd/extract", json={"text": jd_text})
-        jd_id = jd_resp.json()["jd_id"]
-        
-        # Get formatted resume with keywords
-        formatted_resp = client.get(f"/api/resume/{resume_id}/formatted?jd_id={jd_id}")
+        formatted_resp = client.get(
+            f"/api/resume/{uploaded_resume}/formatted?jd_id={extracted_jd}"
+        )
         
         assert formatted_resp.status_code == 200
         data = formatted_resp.json()